@@ -23,12 +23,74 @@ st.set_page_config(
 # ==========================================
 initialize_databases()
 
+# Reference DBs are keyed by file mtime so edits on disk invalidate the cache
+DB_KEYS = ("food_db", "exercise_db", "symptom_db")
+
+
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=4)
+def _load_databases(mtimes):
+    return load_all_databases()
+
+
+def _db_mtimes():
+    return tuple(os.path.getmtime(FILES[k]) if os.path.exists(FILES[k]) else None for k in DB_KEYS)
+
+
+def _get_databases():
+    # cache_data returns a fresh copy, so views may modify the frames safely
+    return _load_databases(_db_mtimes())
+
+
 if "user" not in st.session_state:
     st.session_state["user"] = load_profile()
 user = st.session_state["user"]
 
 # ==========================================
-# 3. MAIN ROUTING
+# 3. PAGE RENDERING
+# ==========================================
+def _sidebar_progress(user):
+    stats = get_daily_stats()
+    net = stats['eaten'] - stats['burnt']
+    target = user['Targets']['Calories']
+
+    st.metric("Net Calories", f"{net:.0f}", delta=f"{target - net:.0f} left")
+    st.progress(min(max(net / target, 0.0), 1.0))
+
+
+def _reload_databases_button():
+    # Only drops this app's DB cache; a global clear would hit every session
+    if st.button("🔄 Reload Databases"):
+        _load_databases.clear()
+        st.rerun()
+
+
+def _render_page(page, user):
+    # Databases are only loaded by the pages that need them
+    if page == "🏠 Dashboard":
+        show_dashboard(user)
+    elif page == "🍎 Food Log":
+        df_food, _, _ = _get_databases()
+        show_food_log(df_food)
+    elif page == "💧 Hydration":
+        show_hydration(user)
+    elif page == "🏃 Fitness":
+        _, df_ex, _ = _get_databases()
+        show_fitness(user, df_ex)
+    elif page == "🔮 Meal Planner":
+        df_food, _, _ = _get_databases()
+        show_meal_planner(user, df_food)
+    elif page == "🩺 Health Advisor":
+        _, _, df_sym = _get_databases()
+        show_health_advisor(df_sym)
+    elif page == "📈 Analytics":
+        show_analytics()
+    elif page == "⚙️ Settings":
+        show_settings(user)
+        _reload_databases_button()
+
+
+# ==========================================
+# 4. MAIN ROUTING
 # ==========================================
 
 # --- VIEW 1: SETUP SCREEN (If no user) ---
@@ -59,9 +121,6 @@ if user is None:
 
 # --- VIEW 2: MAIN DASHBOARD ---
 else:
-    # Load Databases
-    df_food, df_ex, df_sym = load_all_databases()
-
     # --- SIDEBAR NAVIGATION ---
     with st.sidebar:
         st.title(f"👤 {user['Name']}")
@@ -75,27 +134,7 @@ else:
 
         st.markdown("---")
         # Sidebar Progress
-        stats = get_daily_stats()
-        net = stats['eaten'] - stats['burnt']
-        target = user['Targets']['Calories']
-
-        st.metric("Net Calories", f"{net:.0f}", delta=f"{target - net:.0f} left")
-        st.progress(min(max(net / target, 0.0), 1.0))
+        _sidebar_progress(user)
 
     # --- PAGE ROUTING ---
-    if page == "🏠 Dashboard":
-        show_dashboard(user)
-    elif page == "🍎 Food Log":
-        show_food_log(df_food)
-    elif page == "💧 Hydration":
-        show_hydration(user)
-    elif page == "🏃 Fitness":
-        show_fitness(user, df_ex)
-    elif page == "🔮 Meal Planner":
-        show_meal_planner(user, df_food)
-    elif page == "🩺 Health Advisor":
-        show_health_advisor(df_sym)
-    elif page == "📈 Analytics":
-        show_analytics()
-    elif page == "⚙️ Settings":
-        show_settings(user)
\ No newline at end of file
+    _render_page(page, user)
\ No newline at end of file